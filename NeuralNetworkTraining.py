@@ -1,6 +1,16 @@
+import os
+
+# Restrict BLAS to a single thread before numpy is imported. The matrices of this network are tiny (e.g. 30 x 784 times
+# 784 x 100), so starting and synchronising BLAS threads costs more than it saves. Values set in the environment take
+# precedence, so other thread counts can still be benchmarked, e.g. with OPENBLAS_NUM_THREADS=4.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+import argparse
 import numpy as np
 import SimpleNeuralNetwork as snn
-# import packages.NeuralNetworkPython3.chapter1_2.Network as nn
+import packages.NeuralNetworkPython3.chapter1_2.Network as nn
 import loadMnistData as lmd
 import time as tm
 
@@ -8,29 +18,63 @@ import time as tm
 # Declaring constants
 # -------------------
 
-NUM_PIXELS, TRAINING_DATA, VERIFICATION_INPUT, VERIFICATION_RESULT = lmd.load_data_2()  # Load the MNIST data.
-VERIFICATION_DATA = (VERIFICATION_INPUT, VERIFICATION_RESULT)
-
 MINI_BATCH_SIZE = 100  # Size of the mini batches used in the stochastic gradient descent.
 LEARNING_RATE = 3.  # Learning rate often declared as an eta.
 EPOCHS = 50  # Number of epochs used in the stochastic gradient descent.
 NUM_OUTPUT_NEURONS = 10  # Number of neurons in the output layer.
 NUM_HIDDEN_LAYER_NEURONS = 30  # Number of neurons in a hidden layer.
-# Sizes of the layers in the neural network.
-LAYER_SIZES = np.array([NUM_PIXELS, NUM_HIDDEN_LAYER_NEURONS, NUM_OUTPUT_NEURONS])
 
-# ------------------------
-# Setup the neural network
-# ------------------------
+if __name__ == "__main__":
+    # ------------------------------
+    # Parse the command line options
+    # ------------------------------
+
+    parser = argparse.ArgumentParser(description="Train a simple neural network on the MNIST data.")
+    parser.add_argument("--epochs", type=int, default=EPOCHS, help="Number of epochs used in the training.")
+    parser.add_argument("--mini-batch-size", type=int, default=MINI_BATCH_SIZE, help="Size of the mini batches.")
+    parser.add_argument("--learning-rate", type=float, default=LEARNING_RATE, help="Learning rate of the training.")
+    parser.add_argument("--compare", action="store_true",
+                        help="Additionally train the network of Michael Nielsen with the same weights and biases.")
+    args = parser.parse_args()
+
+    NUM_PIXELS, TRAINING_DATA, VERIFICATION_INPUT, VERIFICATION_RESULT = lmd.load_data_2()  # Load the MNIST data.
+    VERIFICATION_DATA = (VERIFICATION_INPUT, VERIFICATION_RESULT)
+    # Sizes of the layers in the neural network.
+    LAYER_SIZES = np.array([NUM_PIXELS, NUM_HIDDEN_LAYER_NEURONS, NUM_OUTPUT_NEURONS])
+
+    # ------------------------
+    # Setup the neural network
+    # ------------------------
+
+    neural_network = snn.SimpleNeuralNetwork(LAYER_SIZES)  # Define the neural network.
+
+    # The reference network starts with the same weights and biases as my network.
+    if args.compare:
+        reference_neural_network = nn.Network(LAYER_SIZES, list(neural_network.weights),
+                                              [snn.convert_array(bias_vec) for bias_vec in neural_network.biases])
+
+    # ----------------------------------
+    # Train the network and view results
+    # ----------------------------------
 
-neural_network = snn.SimpleNeuralNetwork(LAYER_SIZES)  # Define the neural network.
+    start = tm.time()
+    # Let the neural network learn.
+    neural_network.learn(TRAINING_DATA, args.mini_batch_size, args.epochs, args.learning_rate,
+                         verification_data=VERIFICATION_DATA)
+    end = tm.time()
+    print(f"Finished learning. My network needed: {end - start:.2f} s.")
+    print(f"{neural_network.evaluate(*VERIFICATION_DATA)} out of {len(VERIFICATION_RESULT)} verification images are "
+          f"classified correctly.")
 
-# ----------------------------------
-# Train the network and view results
-# ----------------------------------
+    # Training the reference network doubles the run time, so it is only done on request.
+    if args.compare:
+        # Convert the data to the format used by Michael Nielsen.
+        reference_training_data = [(snn.convert_array(x), snn.convert_array(y)) for x, y in zip(*TRAINING_DATA)]
+        reference_verification_data = [(snn.convert_array(x), y) for x, y in
+                                       zip(VERIFICATION_INPUT.T, VERIFICATION_RESULT)]
 
-start = tm.time()
-# Let the neural network learn.
-neural_network.learn(TRAINING_DATA, MINI_BATCH_SIZE, EPOCHS, LEARNING_RATE, verification_data=VERIFICATION_DATA)
-end = tm.time()
-print(f"Finished learning. My network needed: {end - start:.2f} s.")
+        start = tm.time()
+        reference_neural_network.learn(reference_training_data, args.epochs, args.mini_batch_size,
+                                       args.learning_rate, test_data=reference_verification_data)
+        end = tm.time()
+        print(f"Finished learning. The reference network needed: {end - start:.2f} s.")
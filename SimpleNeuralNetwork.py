@@ -1,5 +1,5 @@
 import numpy as np
-import random as rand
+from scipy.special import expit
 from typing import Tuple, List
 
 
@@ -30,18 +30,21 @@ class SimpleNeuralNetwork:
         :param biases: List of bias vectors (1D numpy arrays) added to neurons of each layer.
         """
 
-        self.current_layer = None
         self.layer_sizes = layer_sizes
 
-        # Set weights randomly if no weights are provided.
+        # Set weights randomly if no weights are provided. The standard deviation of the weights is scaled by one over
+        # the square root of the number of inputs of a neuron, so the sigmoid does not saturate at the start of the
+        # training (see chapter 3 of the book). Single precision is sufficient for the network and halves the memory
+        # traffic of the matrix multiplications.
         if weights is None:
-            self.weights = [np.random.randn(y, x) for x, y in zip(self.layer_sizes[:-1], self.layer_sizes[1:])]
+            self.weights = [(np.random.randn(y, x) / np.sqrt(x)).astype(np.float32) for x, y in
+                            zip(self.layer_sizes[:-1], self.layer_sizes[1:])]
         else:
             self.weights = weights
 
         # Set biases randomly if no biases are provided.
         if biases is None:
-            self.biases = [np.random.randn(y) for y in self.layer_sizes[1:]]
+            self.biases = [np.random.randn(y).astype(np.float32) for y in self.layer_sizes[1:]]
         else:
             self.biases = biases
 
@@ -112,7 +115,7 @@ class SimpleNeuralNetwork:
                 raise ValueError("All entries of biases have to be one-dimensional.")
 
             # Check if all the entries in the arrays are numbers.
-            if not (bias_vector.dtype == float or bias_vector.dtype == int):
+            if not (np.issubdtype(bias_vector.dtype, np.floating) or np.issubdtype(bias_vector.dtype, np.integer)):
                 raise TypeError("The entries of the biases have to be real numbers.")
 
         self._biases = new_biases
@@ -127,8 +130,9 @@ class SimpleNeuralNetwork:
         Tested.
         Setter method for the weights which are used in the connection of the layers. Before a the weights are set a
         number of checks is performed. These checks include if the newly entered weights are in a numpy array, if this
-        array has the right shape, if the numpy is filled with numbers and if the shapes of the individual weight
-        matrices correspond to the number of neurons declared by the layer_sizes array.
+        array is a two-dimensional matrix and if the numpy is filled with numbers. Whether the shapes of the individual
+        weight matrices correspond to the number of neurons declared by the layer_sizes array is checked by
+        check_shapes.
 
         :param new_weights: New weights which are set after the checks have been performed.
         :return: None.
@@ -146,11 +150,11 @@ class SimpleNeuralNetwork:
             shape = weight_matrix.shape  # Save the shape of the matrix.
 
             # Check of the shape of each entry
-            if not (len(shape) == 2 or len(shape) == 1):
-                raise ValueError("All entries of weight list have to be one- or two-dimensional.")
+            if len(shape) != 2:
+                raise ValueError("All entries of weight list have to be two-dimensional.")
 
             # Check if the entries a re numbers
-            if not (weight_matrix.dtype == float or weight_matrix.dtype == int):
+            if not (np.issubdtype(weight_matrix.dtype, np.floating) or np.issubdtype(weight_matrix.dtype, np.integer)):
                 raise TypeError("The entries of the weights have to be real numbers.")
 
         self._weights = new_weights
@@ -179,7 +183,30 @@ class SimpleNeuralNetwork:
         :param num: A number
         :return: The value of the sigmoid function using the num as input.
         """
-        return 1. / (1. + np.exp(-num))
+        # expit evaluates 1 / (1 + exp(-num)) in a single pass without allocating temporary arrays.
+        return expit(num)
+
+    @staticmethod
+    def layer_activation(weight_mat: np.ndarray, bias_vec: np.ndarray, activation_mat: np.ndarray) -> np.ndarray:
+        """
+        Calculates the activations of a layer from the activations of the previous layer. The bias and the Sigmoid
+        function are applied in place to the result of the matrix multiplication, so only one new array is allocated.
+
+        :param weight_mat: Weight matrix connecting the previous layer to the layer.
+        :param bias_vec: Bias vector of the layer.
+        :param activation_mat: 2D numpy array containing the activations of the previous layer as columns.
+        :return: 2D numpy array containing the activations of the layer as columns.
+        """
+        z_value_mat = np.dot(weight_mat, activation_mat)
+
+        # The Sigmoid function can only be stored in place in an array of floats.
+        if not np.issubdtype(z_value_mat.dtype, np.floating):
+            z_value_mat = z_value_mat.astype(float)
+
+        # The bias is added in place instead of being folded into the weight matrix as an extra column. Folding would
+        # require appending a row of ones to the activations, which copies the whole input for every mini batch.
+        z_value_mat += bias_vec[:, np.newaxis]
+        return expit(z_value_mat, out=z_value_mat)
 
     @staticmethod
     def cost_func_grad(last_layer_activation, desired_result):
@@ -202,7 +229,8 @@ class SimpleNeuralNetwork:
         """
         Tested.
         This method checks if the shapes of the entries in weights and biases coincide with the entries in layer sizes.
-        If this is not the case an according error is raised.
+        If this is not the case an according error is raised. The weight matrices are guaranteed to be two-dimensional
+        by the setter of the weights.
 
         :return: None.
         """
@@ -212,14 +240,9 @@ class SimpleNeuralNetwork:
             shape = weight_matrix.shape  # Shape of the matrix shape.
 
             # Check if the dimension of the weight matrices coincide with the layer sizes.
-            if len(shape) == 2:
-                if shape[0] != self.layer_sizes[n + 1] or shape[1] != self.layer_sizes[n]:
-                    raise ValueError(f"Shapes {shape} of the {n}-th weight matrix does not coincide with the layer"
-                                     f" sizes {(self.layer_sizes[n + 1], self.layer_sizes[n])} .")
-            elif len(shape) == 1:
-                if shape[0] != self.layer_sizes[n]:
-                    raise ValueError(f"Shapes {shape} of the {n}-th weight matrix does not coincide with the layer"
-                                     f"sizes {self.layer_sizes[n]}.")
+            if shape[0] != self.layer_sizes[n + 1] or shape[1] != self.layer_sizes[n]:
+                raise ValueError(f"Shapes {shape} of the {n}-th weight matrix does not coincide with the layer"
+                                 f" sizes {(self.layer_sizes[n + 1], self.layer_sizes[n])} .")
 
             shape = bias_vector.shape  # Save the vector shape.
 
@@ -234,39 +257,76 @@ class SimpleNeuralNetwork:
         Feeds a collection of inputs through the network. The input is represented by a 2D numpy array in which a
         column represents a single input.
 
+        :param first_layer: 2D numpy array containing the inputs of the network. A single input is represented by a
+            column.
         :return: A 2D numpy array containing all the outputs of the network. A single output is represented by a column.
         """
-        self.current_layer = first_layer  # Reset the current layer regardless if update was called before.
+        activation = first_layer
 
-        # Return a list of numpy arrays corresponding to neurons in the according layer.
+        # Propagate the activations through the layers of the network.
         for weight, bias in zip(self.weights, self.biases):
-            self.current_layer = self.sigmoid_function(np.dot(weight, self.current_layer) + bias[:, np.newaxis])
+            activation = self.layer_activation(weight, bias, activation)
+
+        return activation
 
-        return self.current_layer
+    def feed_forward_all(self, first_layer: np.ndarray) -> List[np.ndarray]:
+        """
+        Feeds a collection of inputs through the network and keeps the activations of every layer. The input is
+        represented by a 2D numpy array in which a column represents a single input.
 
-    def learn(self, learning_data: list, mini_batch_size: int, number_of_epochs: int, learning_rate: float,
-              shuffle_flag: bool = True, verification_data: Tuple[np.ndarray, np.ndarray] = None) -> None:
+        :param first_layer: 2D numpy array containing the inputs of the network. A single input is represented by a
+            column.
+        :return: List of 2D numpy arrays containing the activations of each layer, starting with the input itself.
+        """
+        activations = [first_layer]  # List containing the activations of all inputs for each layer.
+
+        for weight, bias in zip(self.weights, self.biases):
+            activations.append(self.layer_activation(weight, bias, activations[-1]))
+
+        return activations
+
+    def evaluate(self, inputs: np.ndarray, results: np.ndarray) -> int:
+        """
+        Tested.
+        Counts how many inputs are classified correctly by the network. All inputs are fed through the network at once
+        and the classification of an input is the index of the output neuron with the highest activation.
+
+        :param inputs: 2D numpy array containing the inputs of the network. A single input is represented by a column.
+        :param results: 1D numpy array containing the expected index of the output neuron for each input.
+        :return: Number of correctly classified inputs.
+        """
+        return int(np.sum(self.feed_forward(inputs).argmax(axis=0) == results))
+
+    def learn(self, learning_data: Tuple[np.ndarray, np.ndarray], mini_batch_size: int, number_of_epochs: int,
+              learning_rate: float, shuffle_flag: bool = True,
+              verification_data: Tuple[np.ndarray, np.ndarray] = None) -> None:
         """
         Tested.
         This method is the heart of this class. It "teaches" the neural network using the training data which is
         separated into mini batches of the size mini_batch_size. The weights and biases of the network are updated
         after each mini batch using gradient descent which itself is using the back propagation algorithm.
 
-        :param learning_data: Data containing tuples of numpy arrays. The first numpy array contains the input data for
-            the neural network. The second numpy array contains the desired output of the network corresponding to the
-            the input.
+        :param learning_data: Tuple of two 2D numpy arrays. The first array contains the input data for the neural
+            network, the second array contains the desired outputs of the network corresponding to the inputs. In both
+            arrays a row represents a single training example.
         :param mini_batch_size: Number of inputs in a mini batch.
         :param number_of_epochs: Number of epochs that are executed.
         :param learning_rate: Learning rate used in the gradient descent. This number is often declared as the greek
             letter eta in formulae.
         :param shuffle_flag: If this flag is true the input data is shuffled. If the value of the flag is False, the
             learning data is processed as is.
-        :param verification_data: This data has the same format as the learning_data. If data is provided, it is used to
-            see how many images are verified correctly.
+        :param verification_data: Tuple of a 2D numpy array, in which a column represents a single input, and a 1D
+            numpy array containing the expected number for each input. If data is provided, it is used to see how many
+            images are verified correctly.
         :return: None
         """
         self.check_shapes()  # Check the shapes.
-        number_of_training_examples = len(learning_data)
+        all_input_data, all_desired_results = learning_data
+        number_of_training_examples = len(all_input_data)
+
+        # Test if every input has a corresponding desired result.
+        if len(all_desired_results) != number_of_training_examples:
+            raise ValueError("The number of inputs and desired results in the learning data have to coincide.")
 
         # Test if the mini batch size divides the number of training examples if not an error is raised.
         if number_of_training_examples % mini_batch_size == 0:
@@ -278,29 +338,28 @@ class SimpleNeuralNetwork:
         for index in range(number_of_epochs):
             # This line is mostly here for testing reasons.
             if shuffle_flag:
-                # Randomly shuffle the training data.
-                rand.shuffle(learning_data)
-
-            # Recombine the shuffled data.
-            input_data, desired_results = zip(*learning_data)
+                # Randomly shuffle the training data by permuting the rows.
+                permutation = np.random.permutation(number_of_training_examples)
+                input_data, desired_results = all_input_data[permutation], all_desired_results[permutation]
+            else:
+                input_data, desired_results = all_input_data, all_desired_results
 
             # Divide training data into mini batches of the same size.
-            input_data = np.array(input_data).reshape(number_of_mini_batches, mini_batch_size, self.layer_sizes[0])
-            desired_results = np.array(desired_results).reshape(number_of_mini_batches, mini_batch_size,
-                                                                self.layer_sizes[-1])
+            input_data = input_data.reshape(number_of_mini_batches, mini_batch_size, self.layer_sizes[0])
+            desired_results = desired_results.reshape(number_of_mini_batches, mini_batch_size, self.layer_sizes[-1])
 
             # Updates the weights and biases after going through the training data of a mini batch.
             for input_data_mat, desired_result_mat in zip(input_data, desired_results):
-                # The data needs to be transposed since to have the right format for the matrix multiplications,
+                # The data needs to be transposed to have the right format for the matrix multiplications. The
+                # transposes are views which numpy hands to BLAS as transposed operands without copying them, so the
+                # weights keep the (output, input) shape used in the book instead of being stored pre-transposed.
                 self.update_weights_and_biases((input_data_mat.T, desired_result_mat.T), mini_batch_size,
                                                learning_rate)
 
             # Use verification data if it provided.
-            # TODO: I could probably make this much more efficient using matrix multiplication.
             if verification_data is not None:
                 # Count the correctly classified results.
-                counter = np.sum(verification_data[1] == np.apply_along_axis(np.argmax, 0,
-                                                                             self.feed_forward(verification_data[0])))
+                counter = self.evaluate(*verification_data)
                 # Print the result of how many images are identified correctly.
                 print(f"Epoch {index + 1}: {counter} out of {len(verification_data[1])}.")
             else:
@@ -320,25 +379,20 @@ class SimpleNeuralNetwork:
             often declared as an eta.
         :return: None.
         """
-        activations = [mini_batch[0]]  # List containing the activations of all inputs for each layer.
-        z_values = []  # List containing the z values of all inputs for each layer.
-
         # --------------------------
         # Back propagation algorithm
         # --------------------------
 
-        # Calculate the activations and the z values.
-        for weight_mat, bias_vec in zip(self.weights, self.biases):
-            z_value_mat = np.dot(weight_mat, activations[-1]) + bias_vec[:, np.newaxis]
-            z_values.append(z_value_mat)
-            activations.append(self.sigmoid_function(z_value_mat))
+        # Calculate the activations. The z values are not stored, since the derivative of the Sigmoid function can be
+        # expressed through the activations: sigmoid'(z) = sigmoid(z) * (1 - sigmoid(z)).
+        activations = self.feed_forward_all(mini_batch[0])
 
         # The delta values of the last layer.
-        deltas = [np.multiply(self.cost_func_grad(activations[-1], mini_batch[1]), self.sigmoid_derivative(z_values[-1]))]
+        deltas = [self.cost_func_grad(activations[-1], mini_batch[1]) * activations[-1] * (1. - activations[-1])]
 
         # Calculate the delta values.
-        for weight_mat, z_value_mat in zip(reversed(self.weights[1:]), reversed(z_values[:-1])):
-            deltas.insert(0, np.multiply(np.dot(weight_mat.T, deltas[0]), self.sigmoid_derivative(z_value_mat)))
+        for weight_mat, activation_mat in zip(reversed(self.weights[1:]), reversed(activations[1:-1])):
+            deltas.insert(0, np.dot(weight_mat.T, deltas[0]) * activation_mat * (1. - activation_mat))
 
         # -------------------------
         # Update weights and biases
@@ -346,7 +400,9 @@ class SimpleNeuralNetwork:
 
         const = learning_rate / mini_batch_size  # Constant used to calculate the mean gradient.
 
-        # Update the weights and the biases.
-        self.weights = [weight_mat - const * np.dot(delta_mat, activation_mat.T) for
-                        delta_mat, activation_mat, weight_mat in zip(deltas, activations[:-1], self.weights)]
-        self.biases = [bias_vec - const * delta_mat.sum(axis=1) for delta_mat, bias_vec in zip(deltas, self.biases)]
+        # Update the weights and the biases. The new values are assigned to the private fields directly, since they are
+        # derived from already validated weights and biases. Otherwise the checks of the setters would run for every
+        # mini batch.
+        self._weights = [weight_mat - const * np.dot(delta_mat, activation_mat.T) for
+                         delta_mat, activation_mat, weight_mat in zip(deltas, activations[:-1], self._weights)]
+        self._biases = [bias_vec - const * delta_mat.sum(axis=1) for delta_mat, bias_vec in zip(deltas, self._biases)]
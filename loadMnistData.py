@@ -2,28 +2,31 @@ from keras.datasets import mnist
 import numpy as np
 from typing import Tuple, List
 
+# Identity matrix whose rows are the one-hot representations of the digits 0 to 9. It is read-only, since its rows are
+# handed out by convert_number.
+_ONE_HOT = np.eye(10, dtype=np.float32)
+_ONE_HOT.setflags(write=False)
+
 
 def convert_number(number: int) -> np.ndarray:
     """
     This function converts a number of the training data of the expected results to a numpy array with a one at the
-    index num.
+    index num. The returned array is a read-only view, copy it before modifying it.
 
     :return: Numpy array with a 1 at the index num.
     """
-    vec = np.zeros(10)
-    vec[number] = 1.
-    return vec
+    return _ONE_HOT[number]
 
 
-def load_data() -> Tuple[int, list, list]:
+def load_data() -> Tuple[int, Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
     """
     Loads the training data and verification data of the MNIST library. The images of the MNIST libraries are
     represented by 1D numpy arrays with 8 Bit values representing the gray scale of the pixels in the images.
 
 
-    :return: Returns the number of pixels in the images, a list of tuples of numpy arrays containing the training inputs
-        and the corresponding correct output and a list of tuples of lists containing the verification input
-        (numpy array) and an int representing the number described by the corresponding numpy array.
+    :return: Returns the number of pixels in the images, a tuple of two numpy arrays containing the training inputs
+        and the corresponding correct outputs as rows and a tuple of two numpy arrays containing the verification
+        inputs as columns and the numbers represented by the corresponding inputs.
     """
     num_pixels = 784  # Number  of pixels in a image.
 
@@ -33,30 +36,34 @@ def load_data() -> Tuple[int, list, list]:
     # test_results = List of numbers that the images in test_inputs are representing.
     (train_inputs, desired_results), (test_inputs, test_results) = mnist.load_data()  # Load the test data
 
-    # Convert the elements of the desired results from numbers to numpy arrays.
-    converted_desired_results = np.array([convert_number(num) for num in desired_results])
-    # Reshape the training input so that each entry is a 1D vector.
-    train_inputs = train_inputs.reshape(len(train_inputs), num_pixels)
-    # Make the training data a list of tuples of numpy arrays.
-    training_data = list(zip(train_inputs / 255., converted_desired_results))
+    # Convert the elements of the desired results from numbers to numpy arrays by picking the according rows of the
+    # identity matrix.
+    converted_desired_results = _ONE_HOT[desired_results]
+    # Reshape the training input so that each entry is a 1D vector. The gray scales are mapped to the interval [0, 1].
+    # Single precision is plenty for this and halves the memory footprint compared to double precision.
+    train_inputs = train_inputs.reshape(len(train_inputs), num_pixels).astype(np.float32)
+    train_inputs /= 255.  # Scale in place to avoid a second copy of the data set.
+    # Keep the inputs and desired results as two separate matrices.
+    training_data = (train_inputs, converted_desired_results)
 
     # Reshape the test inputs so that the entries are 1D instead of 2D.
-    test_inputs = test_inputs.reshape(len(test_inputs), num_pixels)
-    # Create a list of tuples with the input and the corresponding result
-    verification_data = list(zip(test_inputs / 255., test_results))
+    test_inputs = test_inputs.reshape(len(test_inputs), num_pixels).astype(np.float32)
+    test_inputs /= 255.  # Scale in place to avoid a second copy of the data set.
+    # The verification inputs are stored as columns, which is the format used by the feed forward method.
+    verification_data = (test_inputs.T, test_results)
 
     return num_pixels, training_data, verification_data
 
 
-def load_data_2() -> Tuple[int, List[Tuple[np.ndarray, np.ndarray]], np.ndarray, np.ndarray]:
+def load_data_2() -> Tuple[int, Tuple[np.ndarray, np.ndarray], np.ndarray, np.ndarray]:
     """
     Loads the training data and verification data of the MNIST library. The images of the MNIST libraries are
     represented by 1D numpy arrays with 8 Bit values representing the gray scale of the pixels in the images.
 
 
-    :return: Returns the number of pixels in the images, a list of tuples of numpy arrays containing the training inputs
-        and the corresponding correct output and a two numpy arrays containing the verification data and corresponding
-        result.
+    :return: Returns the number of pixels in the images, a tuple of two numpy arrays containing the training inputs
+        and the corresponding correct outputs as rows and a two numpy arrays containing the verification data and
+        corresponding result.
     """
     num_pixels = 784  # Number  of pixels in a image.
 
@@ -66,15 +73,19 @@ def load_data_2() -> Tuple[int, List[Tuple[np.ndarray, np.ndarray]], np.ndarray,
     # test_results = List of numbers that the images in test_inputs are representing.
     (train_inputs, desired_results), (test_inputs, test_results) = mnist.load_data()  # Load the test data
 
-    # Convert the elements of the desired results from numbers to numpy arrays.
-    converted_desired_results = np.array([convert_number(num) for num in desired_results])
-    # Reshape the training input so that each entry is a 1D vector.
-    train_inputs = train_inputs.reshape(len(train_inputs), num_pixels)
-    # Make the training data a list of tuples of numpy arrays.
-    training_data = list(zip(train_inputs / 255., converted_desired_results))
+    # Convert the elements of the desired results from numbers to numpy arrays by picking the according rows of the
+    # identity matrix.
+    converted_desired_results = _ONE_HOT[desired_results]
+    # Reshape the training input so that each entry is a 1D vector. The gray scales are mapped to the interval [0, 1].
+    # Single precision is plenty for this and halves the memory footprint compared to double precision.
+    train_inputs = train_inputs.reshape(len(train_inputs), num_pixels).astype(np.float32)
+    train_inputs /= 255.  # Scale in place to avoid a second copy of the data set.
+    # Keep the inputs and desired results as two separate matrices.
+    training_data = (train_inputs, converted_desired_results)
 
     # Reshape the test inputs so that the entries are 1D instead of 2D.
-    test_inputs = test_inputs.reshape(len(test_inputs), num_pixels) / 255.
+    test_inputs = test_inputs.reshape(len(test_inputs), num_pixels).astype(np.float32)
+    test_inputs /= 255.  # Scale in place to avoid a second copy of the data set.
     # print(test_inputs.T.shape)
 
     return num_pixels, training_data, test_inputs.T, test_results
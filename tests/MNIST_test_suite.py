@@ -45,8 +45,10 @@ class MnistTestCase(unittest.TestCase):
         self.reference_neural_network = nn.Network(layer_sizes, weights, biases)
 
         # Convert data to the format Michael Nielsen uses.
-        self.reference_training_data = [(snn.convert_array(x), snn.convert_array(y)) for x, y in self.training_data]
-        self.reference_verification_data = [(snn.convert_array(x), y) for x, y in self.verification_data]
+        self.reference_training_data = [(snn.convert_array(x), snn.convert_array(y)) for x, y in
+                                        zip(*self.training_data)]
+        self.reference_verification_data = [(snn.convert_array(x), y) for x, y in
+                                            zip(self.verification_data[0].T, self.verification_data[1])]
 
     def test_weights_and_biases(self) -> None:
         """
@@ -76,15 +78,15 @@ class MnistTestCase(unittest.TestCase):
         mini_batch_size = 1000
 
         # Pick a random subset of the MNIST data with 1000 elements.
-        random_mini_batch = rn.sample(self.training_data, mini_batch_size)
-        # Recombine the shuffled data.
-        input_data, desired_results = zip(*random_mini_batch)
+        random_indices = rn.sample(range(len(self.training_data[0])), mini_batch_size)
+        input_data, desired_results = self.training_data[0][random_indices], self.training_data[1][random_indices]
         # Convert the random subset to the data format of Michael Nielsen.
-        reference_mini_batch = [(snn.convert_array(x), snn.convert_array(y)) for x, y in random_mini_batch]
+        reference_mini_batch = [(snn.convert_array(x), snn.convert_array(y)) for x, y in
+                                zip(input_data, desired_results)]
 
         # Update both networks once.
-        self.neural_network.update_weights_and_biases((np.array(input_data).T, np.array(desired_results).T),
-                                                      mini_batch_size, learning_rate)
+        self.neural_network.update_weights_and_biases((input_data.T, desired_results.T), mini_batch_size,
+                                                      learning_rate)
         self.reference_neural_network.update_mini_batch(reference_mini_batch, learning_rate)
 
         # Test if the resulting weights and biases are the same.
@@ -69,9 +69,13 @@ class SimpleNeuralNetworkTestCase(ut.TestCase):
         with self.assertRaises(ValueError):
             self.first_neural_network.weights = [np.array([[[1, 1], [1, 1]], [[1, 1], [1, 1]]]), np.array([1])]
 
+        # Tests if one-dimensional weights raise an error.
+        with self.assertRaises(ValueError):
+            self.first_neural_network.weights = [np.array([1, 1, 1, 1]), np.array([1, 1, 1, 1])]
+
         # Test if the entries of the weight matrices are numbers.
         with self.assertRaises(TypeError):
-            self.first_neural_network.weights = [np.array(["Hello"])]
+            self.first_neural_network.weights = [np.array([["Hello"]])]
 
         # Test if new weights are declared correctly.
         new_weights = [np.array([[1, 1, 1, 1], [1, 1, 1, 1], [1, 1, 1, 1], [1, 1, 1, 1]]),
@@ -156,8 +160,8 @@ class SimpleNeuralNetworkTestCase(ut.TestCase):
         :return: None
         """
         # Tests if weight matrices with the wrong shape raise an error.
-        self.first_neural_network.weights = [np.array([[1, 1], [1, 1]]), np.array([[1, 1], [1, 1]]), np.array([1])]
-        self.second_neural_network.weights = [np.array([[1, 1], [1, 1]]), np.array([[1, 1], [1, 1]]), np.array([1])]
+        self.first_neural_network.weights = [np.array([[1, 1], [1, 1]]), np.array([[1, 1], [1, 1]]), np.array([[1]])]
+        self.second_neural_network.weights = [np.array([[1, 1], [1, 1]]), np.array([[1, 1], [1, 1]]), np.array([[1]])]
 
         with self.assertRaises(ValueError):
             self.first_neural_network.check_shapes()
@@ -184,6 +188,19 @@ class SimpleNeuralNetworkTestCase(ut.TestCase):
 
         np.testing.assert_array_almost_equal(second_result, np.array([0.9481003474891515]))
 
+    def test_evaluate(self) -> None:
+        """
+        Tests if the evaluate method counts the correctly classified inputs.
+
+        :return: None.
+        """
+        # Each column is an input which activates a single neuron of the first network strongly.
+        inputs = 5 * np.eye(4)
+
+        self.assertEqual(self.first_neural_network.evaluate(inputs, np.array([0, 1, 2, 3])), 4)
+        self.assertEqual(self.first_neural_network.evaluate(inputs, np.array([0, 1, 2, 2])), 3)
+        self.assertEqual(self.first_neural_network.evaluate(inputs, np.array([3, 2, 1, 0])), 0)
+
     def test_sigmoid_function(self) -> None:
         """
         Tests the sigmoid function.